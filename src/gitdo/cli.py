@@ -3,28 +3,82 @@
 from pathlib import Path
 
 import click
+import orjson
 from rich.console import Console
 from rich.table import Table
 
 from . import __version__
 from .markdown_parser import parse_markdown_file
-from .storage import Storage
+from .storage import Storage, get_storage
 
 console = Console()
 
+# Status -> Rich color used when rendering task tables.
+STATUS_COLOR = {
+    "completed": "green",
+    "inprogress": "blue",
+    "pending": "yellow",
+}
+
+# Sort order for the list command: inprogress first, then pending, then completed.
+STATUS_PRIORITY = {"inprogress": 0, "pending": 1, "completed": 2}
+
+# Flush the list table to the terminal every this many rows so huge task
+# stores render incrementally instead of buffering everything.
+LIST_CHUNK_SIZE = 500
+
+
+# Width of the fixed list columns (ID 10, Status 12, Created 20) plus the
+# table chrome around four columns: 2 cells of padding per column and 5
+# vertical border characters.
+_LIST_FIXED_OVERHEAD = 10 + 12 + 20 + 4 * 2 + 5
+
+
+def _new_task_table(*, show_header: bool = True, task_width: int | None = None) -> Table:
+    """Create an empty table with the list command's columns.
+
+    Args:
+        show_header: Whether to render the column headers
+        task_width: Explicit width for the Task column. Chunked rendering
+            passes one derived from the console width so every chunk gets
+            identical geometry; each chunk is a separate Table, and any
+            content-measured column would size per chunk and break
+            alignment. None lets the column size to its content.
+    """
+    table = Table(show_header=show_header, header_style="bold magenta")
+    table.add_column("ID", style="dim", width=10)
+    table.add_column("Task", width=task_width)
+    table.add_column("Status", width=12)
+    table.add_column("Created", width=20)
+    return table
+
 
 @click.group()
 @click.version_option(version=__version__)
-def cli():
+@click.pass_context
+def cli(ctx: click.Context):
     """GitDo - Simple CLI tool to plan your work."""
-    pass
+    ctx.ensure_object(dict)
+
+
+def _get_storage(ctx: click.Context) -> Storage:
+    """Return the per-invocation Storage, creating it on first use.
+
+    Constructing Storage walks up the directory tree looking for .gitdo/;
+    sharing one instance through the Click context means that walk (and the
+    task cache it carries) happens once per process.
+    """
+    storage = ctx.obj.get("storage")
+    if storage is None:
+        storage = ctx.obj["storage"] = get_storage()
+    return storage
 
 
 @cli.command()
 def init():
     """Initialize a new GitDo project."""
     # Use current directory explicitly to allow nested projects
-    storage = Storage(base_path=Path.cwd())
+    storage = get_storage(base_path=Path.cwd())
     if storage.is_initialized():
         console.print("[yellow]GitDo is already initialized in this directory.[/yellow]")
         return
@@ -36,14 +90,20 @@ def init():
 
 @cli.command()
 @click.argument("task")
-def add(task: str):
+@click.option("--json", "as_json", is_flag=True, help="Emit the created task as JSON")
+@click.pass_context
+def add(ctx: click.Context, task: str, as_json: bool):
     """Add a new task to your project."""
-    storage = Storage()
+    storage = _get_storage(ctx)
     if not storage.is_initialized():
         console.print("[red]Error:[/red] GitDo is not initialized. Run 'gitdo init' first.")
         raise click.Abort()
 
     created_task = storage.add_task(task)
+    if as_json:
+        # Machine-readable output for scripts and tests; no Rich markup to scrape
+        click.echo(orjson.dumps(created_task.to_dict()).decode())
+        return
     console.print(f"[green]✓[/green] Added task: {created_task.title}")
     console.print(f"[dim]ID: {created_task.id[:8]}[/dim]")
 
@@ -56,61 +116,66 @@ def add(task: str):
     help="Filter tasks by status",
 )
 @click.option("--all", "-a", is_flag=True, help="Show all tasks (overrides --status)")
-def list(status: str | None, all: bool):
+@click.pass_context
+def list(ctx: click.Context, status: str | None, all: bool):
     """List all tasks."""
-    storage = Storage()
+    storage = _get_storage(ctx)
     if not storage.is_initialized():
         console.print("[red]Error:[/red] GitDo is not initialized. Run 'gitdo init' first.")
         raise click.Abort()
 
-    tasks = storage.load_tasks()
+    # Raw display rows: listing never mutates, so skip Task construction
+    # and the datetime parse/format roundtrip per task.
+    rows = storage.load_task_rows()
 
     # Filter by status if specified
     if not all:
         if status:
-            tasks = [t for t in tasks if t.status.value == status.lower()]
+            wanted = status.lower()
+            rows = [row for row in rows if row[2] == wanted]
         else:
             # Default: show pending and inprogress tasks
-            tasks = [t for t in tasks if t.status.value in ["pending", "inprogress"]]
+            rows = [row for row in rows if row[2] in ("pending", "inprogress")]
 
-    if not tasks:
+    if not rows:
         console.print("[yellow]No tasks found.[/yellow]")
         return
 
     # Sort tasks: inprogress first, then pending, then completed
-    status_priority = {"inprogress": 0, "pending": 1, "completed": 2}
-    tasks = sorted(tasks, key=lambda t: status_priority.get(t.status.value, 3))
+    rows.sort(key=lambda row: STATUS_PRIORITY.get(row[2], 3))
 
-    table = Table(show_header=True, header_style="bold magenta")
-    table.add_column("ID", style="dim", width=10)
-    table.add_column("Task")
-    table.add_column("Status", width=12)
-    table.add_column("Created", width=20)
-
-    for task in tasks:
-        # Color coding for different statuses
-        if task.status.value == "completed":
-            status_color = "green"
-        elif task.status.value == "inprogress":
-            status_color = "blue"
-        else:
-            status_color = "yellow"
+    # Multi-chunk lists need a fixed Task width so chunks line up;
+    # single-chunk lists keep the content-sized column.
+    task_width = None
+    if len(rows) > LIST_CHUNK_SIZE:
+        task_width = max(10, console.width - _LIST_FIXED_OVERHEAD)
 
+    table = _new_task_table(task_width=task_width)
+    for i, (task_id, title, status_value, created_iso) in enumerate(rows, start=1):
+        status_color = STATUS_COLOR.get(status_value, "yellow")
         table.add_row(
-            task.id[:8],
-            task.title,
-            f"[{status_color}]{task.status.value}[/{status_color}]",
-            task.created_at.strftime("%Y-%m-%d %H:%M:%S"),
+            task_id[:8],
+            title,
+            f"[{status_color}]{status_value}[/{status_color}]",
+            # Slicing the ISO string replicates %Y-%m-%d %H:%M:%S
+            created_iso[:19].replace("T", " "),
         )
+        # Flush periodically so very large lists appear incrementally and
+        # the formatted rows don't all accumulate before the first output.
+        if i % LIST_CHUNK_SIZE == 0:
+            console.print(table)
+            table = _new_task_table(show_header=False, task_width=task_width)
 
-    console.print(table)
+    if table.row_count:
+        console.print(table)
 
 
 @cli.command()
 @click.argument("task_id")
-def start(task_id: str):
+@click.pass_context
+def start(ctx: click.Context, task_id: str):
     """Mark a task as in progress."""
-    storage = Storage()
+    storage = _get_storage(ctx)
     if not storage.is_initialized():
         console.print("[red]Error:[/red] GitDo is not initialized. Run 'gitdo init' first.")
         raise click.Abort()
@@ -124,9 +189,10 @@ def start(task_id: str):
 
 @cli.command()
 @click.argument("task_id")
-def complete(task_id: str):
+@click.pass_context
+def complete(ctx: click.Context, task_id: str):
     """Mark a task as completed."""
-    storage = Storage()
+    storage = _get_storage(ctx)
     if not storage.is_initialized():
         console.print("[red]Error:[/red] GitDo is not initialized. Run 'gitdo init' first.")
         raise click.Abort()
@@ -140,9 +206,10 @@ def complete(task_id: str):
 
 @cli.command()
 @click.argument("task_id")
-def remove(task_id: str):
+@click.pass_context
+def remove(ctx: click.Context, task_id: str):
     """Remove a task from your project."""
-    storage = Storage()
+    storage = _get_storage(ctx)
     if not storage.is_initialized():
         console.print("[red]Error:[/red] GitDo is not initialized. Run 'gitdo init' first.")
         raise click.Abort()
@@ -166,7 +233,9 @@ def remove(task_id: str):
     is_flag=True,
     help="Preview tasks without importing",
 )
+@click.pass_context
 def import_md(
+    ctx: click.Context,
     file_path: Path,
     *,
     skip_duplicates: bool,
@@ -179,7 +248,7 @@ def import_md(
     - [ ] Task title (pending)
     - [x] Task title (completed)
     """
-    storage = Storage()
+    storage = _get_storage(ctx)
     if not storage.is_initialized():
         console.print("[red]Error:[/red] GitDo is not initialized. Run 'gitdo init' first.")
         raise click.Abort()
@@ -203,32 +272,31 @@ def import_md(
     table.add_column("Status", width=12)
 
     for task in tasks:
-        # Color coding for different statuses
-        if task.status.value == "completed":
-            status_color = "green"
-        elif task.status.value == "inprogress":
-            status_color = "blue"
-        else:
-            status_color = "yellow"
-
+        status_color = STATUS_COLOR.get(task.status.value, "yellow")
         table.add_row(
             task.title,
             f"[{status_color}]{task.status.value}[/{status_color}]",
         )
 
-    console.print(f"\n[bold]Found {len(tasks)} task(s) in {file_path}:[/bold]")
-    console.print(table)
-
     if dry_run:
+        console.print(f"\n[bold]Found {len(tasks)} task(s) in {file_path}:[/bold]")
+        console.print(table)
         console.print("\n[dim]Dry run - no tasks were imported[/dim]")
         return
 
-    # Import tasks
+    # Import tasks; the save happens in the background while Rich lays out
+    # and prints the preview table, hiding the write latency.
     imported_count, skipped_count = storage.import_tasks(
         tasks,
         skip_duplicates=skip_duplicates,
     )
 
+    console.print(f"\n[bold]Found {len(tasks)} task(s) in {file_path}:[/bold]")
+    console.print(table)
+
+    # Make sure the write has landed before reporting success
+    storage.flush()
+
     # Display results
     console.print(f"\n[green]✓[/green] Imported {imported_count} task(s)")
     if skipped_count > 0:
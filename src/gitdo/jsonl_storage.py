@@ -0,0 +1,233 @@
+"""Append-only JSON-Lines storage for GitDo."""
+
+import os
+from datetime import datetime
+from pathlib import Path
+from uuid import uuid4
+
+import orjson
+
+from .models import Task, TaskStatus
+from .storage import Storage
+
+
+class JsonlStorage(Storage):
+    """Task storage that appends mutations to a JSON-Lines log.
+
+    The base Storage rewrites all of tasks.json for every mutation, so a
+    single add/complete/remove costs O(N) in total task count. Here each
+    mutation appends one small record to tasks.log.jsonl; tasks.json is
+    kept as a snapshot and the log is replayed on load. When the log
+    outgrows half the snapshot it is compacted back into tasks.json.
+    Select with ``GITDO_STORAGE=jsonl``.
+    """
+
+    def __init__(self, base_path: Path | None = None):
+        """Initialize JSON-Lines storage.
+
+        Args:
+            base_path: Base path for storage. If None, searches for .gitdo/
+                      by walking up from current directory.
+        """
+        super().__init__(base_path)
+        self.log_file = self.storage_dir / "tasks.log.jsonl"
+
+    def load_tasks(self) -> list[Task]:
+        """Load all tasks from the snapshot plus the mutation log.
+
+        Returns:
+            List of tasks
+        """
+        tasks = self._replay_log(super().load_tasks())
+        # The base prefix index only covers the snapshot; rebuild it for
+        # the replayed list so inherited lookups stay correct.
+        self._build_prefix_index(tasks)
+        return tasks
+
+    def load_task_rows(self) -> list[tuple[str, str, str, str]]:
+        """Load tasks as display rows from the replayed task list.
+
+        Returns:
+            List of (id, title, status, created_at_iso) tuples
+        """
+        return [
+            (task.id, task.title, task.status.value, task.to_dict()["created_at"])
+            for task in self.load_tasks()
+        ]
+
+    def add_task(self, title: str) -> Task:
+        """Add a new task.
+
+        Args:
+            title: Task title
+
+        Returns:
+            Created task
+        """
+        task = Task(id=str(uuid4()), title=title)
+        self._append_ops([{"op": "add", "task": task.to_dict()}])
+        return task
+
+    def add_tasks(self, titles: list[str]) -> list[Task]:
+        """Add multiple tasks in one log append.
+
+        Args:
+            titles: Task titles
+
+        Returns:
+            List of created tasks
+        """
+        created = [Task(id=str(uuid4()), title=title) for title in titles]
+        if created:
+            self._append_ops([{"op": "add", "task": task.to_dict()} for task in created])
+        return created
+
+    def start_task(self, task_id: str) -> bool:
+        """Mark task as in progress.
+
+        Args:
+            task_id: Task ID
+
+        Returns:
+            True if task was found and started, False otherwise
+        """
+        tasks = self.load_tasks()
+        index = self._find_task_index(tasks, task_id)
+        if index is None:
+            return False
+        self._append_ops([{"op": "start", "id": tasks[index].id}])
+        return True
+
+    def complete_task(self, task_id: str) -> bool:
+        """Mark task as completed.
+
+        Args:
+            task_id: Task ID
+
+        Returns:
+            True if task was found and completed, False otherwise
+        """
+        tasks = self.load_tasks()
+        index = self._find_task_index(tasks, task_id)
+        if index is None:
+            return False
+        task = tasks[index]
+        task.complete()
+        # Record the timestamp so replay doesn't re-stamp completion time.
+        self._append_ops(
+            [
+                {
+                    "op": "complete",
+                    "id": task.id,
+                    "completed_at": task.completed_at.isoformat(),
+                }
+            ]
+        )
+        return True
+
+    def remove_task(self, task_id: str) -> bool:
+        """Remove task.
+
+        Args:
+            task_id: Task ID
+
+        Returns:
+            True if task was found and removed, False otherwise
+        """
+        tasks = self.load_tasks()
+        index = self._find_task_index(tasks, task_id)
+        if index is None:
+            return False
+        self._append_ops([{"op": "remove", "id": tasks[index].id}])
+        return True
+
+    def import_tasks(
+        self,
+        tasks: list[Task],
+        *,
+        skip_duplicates: bool = False,
+    ) -> tuple[int, int]:
+        """Import multiple tasks at once.
+
+        Args:
+            tasks: List of tasks to import
+            skip_duplicates: If True, skip tasks with duplicate titles
+
+        Returns:
+            Tuple of (imported_count, skipped_count)
+        """
+        existing_hashes = (
+            {hash(task.title) for task in self.load_tasks()} if skip_duplicates else set()
+        )
+
+        ops = []
+        skipped_count = 0
+        for task in tasks:
+            title_hash = hash(task.title)
+            if skip_duplicates and title_hash in existing_hashes:
+                skipped_count += 1
+                continue
+            ops.append({"op": "add", "task": task.to_dict()})
+            existing_hashes.add(title_hash)
+
+        if ops:
+            self._append_ops(ops)
+        return len(ops), skipped_count
+
+    def _append_ops(self, ops: list[dict]) -> None:
+        """Append mutation records to the log in one write."""
+        with open(self.log_file, "ab") as f:
+            f.write(b"".join(orjson.dumps(op) + b"\n" for op in ops))
+        self._maybe_compact()
+
+    def _read_log(self) -> list[dict]:
+        """Read all mutation records from the log."""
+        try:
+            raw = self.log_file.read_bytes()
+        except FileNotFoundError:
+            return []
+        return [orjson.loads(line) for line in raw.splitlines() if line]
+
+    def _replay_log(self, tasks: list[Task]) -> list[Task]:
+        """Apply logged mutations on top of the snapshot task list."""
+        ops = self._read_log()
+        if not ops:
+            return tasks
+
+        ids = {task.id for task in tasks}
+        for op in ops:
+            kind = op["op"]
+            if kind == "add":
+                # Skip records already compacted into the snapshot (e.g.
+                # after a crash between snapshot write and log truncate).
+                if op["task"]["id"] not in ids:
+                    tasks.append(Task.from_dict(op["task"]))
+                    ids.add(op["task"]["id"])
+                continue
+
+            index = next((i for i, t in enumerate(tasks) if t.id == op["id"]), None)
+            if index is None:
+                continue
+            if kind == "start":
+                tasks[index].status = TaskStatus.INPROGRESS
+            elif kind == "complete":
+                tasks[index].status = TaskStatus.COMPLETED
+                tasks[index].completed_at = datetime.fromisoformat(op["completed_at"])
+            elif kind == "remove":
+                ids.discard(op["id"])
+                tasks[index] = tasks[-1]
+                tasks.pop()
+        return tasks
+
+    def _maybe_compact(self) -> None:
+        """Fold the log back into the snapshot once it grows large enough."""
+        try:
+            log_size = os.stat(self.log_file).st_size
+            snapshot_size = os.stat(self.tasks_file).st_size
+        except OSError:
+            return
+        if log_size <= snapshot_size // 2:
+            return
+
+        self._save_tasks(self.load_tasks())
+        self.log_file.unlink(missing_ok=True)
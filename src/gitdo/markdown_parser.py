@@ -1,11 +1,24 @@
 """Markdown file parser for extracting tasks."""
 
 import re
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from uuid import uuid4
 
 from .models import Task, TaskStatus
 
+try:
+    # Optional native (Rust) markdown parser; install with `pip install gitdo[fast]`.
+    import pyromark
+except ImportError:
+    pyromark = None
+
+# Pattern matches: - [ ] or - [x] or - [X] followed by task title, with any
+# of the three markdown list markers (-, *, +). Supports various indentation
+# levels; trailing whitespace is consumed by the pattern so no .strip() is
+# needed on the title group.
+_CHECKBOX_RE = re.compile(r"^\s*[-*+]\s+\[([ xX])\]\s+(.+?)\s*$", re.MULTILINE)
+
 
 def extract_checkbox_items(content: str) -> list[tuple[str, bool]]:
     """Extract checkbox items from markdown content.
@@ -16,22 +29,61 @@ def extract_checkbox_items(content: str) -> list[tuple[str, bool]]:
     Returns:
         List of (title, is_completed) tuples
     """
-    # Pattern matches: - [ ] or - [x] or - [X] followed by task title
-    # Supports various indentation levels
-    pattern = r"^\s*-\s+\[([ xX])\]\s+(.+)$"
-    items = []
+    if pyromark is not None:
+        return _extract_checkbox_items_native(content)
+    # finditer lets the C engine walk the whole content without building a
+    # list of lines first.
+    return [
+        (match.group(2), match.group(1) in ("x", "X")) for match in _CHECKBOX_RE.finditer(content)
+    ]
 
-    for line in content.splitlines():
-        match = re.match(pattern, line)
-        if match:
-            checkbox_state = match.group(1)
-            title = match.group(2).strip()
-            is_completed = checkbox_state.lower() == "x"
-            items.append((title, is_completed))
+
+def _extract_checkbox_items_native(content: str) -> list[tuple[str, bool]]:
+    """Extract checkbox items using the pyromark (pulldown-cmark) parser.
+
+    Tracks ``TaskListMarker`` events and collects the item's text until the
+    list item ends or a nested task item starts.
+    """
+    items = []
+    checked: bool | None = None
+    texts: list[str] = []
+
+    for event in pyromark.events(content, options=pyromark.Options.ENABLE_TASKLISTS):
+        if not isinstance(event, dict):
+            continue
+        if "TaskListMarker" in event:
+            # A nested task item starts before the parent item ends; flush
+            # the parent first.
+            if checked is not None:
+                items.append(("".join(texts).strip(), checked))
+            checked = event["TaskListMarker"]
+            texts = []
+        elif checked is None:
+            continue
+        elif "Text" in event:
+            texts.append(event["Text"])
+        elif "Code" in event:
+            texts.append(event["Code"])
+        elif event.get("End") == "Item":
+            items.append(("".join(texts).strip(), checked))
+            checked = None
 
     return items
 
 
+def _iter_checkbox_items(lines: Iterable[str]) -> Iterator[tuple[str, bool]]:
+    """Yield (title, is_completed) for each checkbox line in an iterable."""
+    for line in lines:
+        # Cheap prefilter: most lines in real documents aren't list items
+        # at all, so reject them before entering the regex engine. lstrip
+        # returns the line unchanged (no copy) when there's no indentation.
+        if not line.lstrip().startswith(("-", "*", "+")):
+            continue
+        match = _CHECKBOX_RE.match(line)
+        if match:
+            yield match.group(2), match.group(1) in ("x", "X")
+
+
 def parse_markdown_file(file_path: Path) -> list[Task]:
     """Parse markdown file and extract tasks.
 
@@ -49,11 +101,16 @@ def parse_markdown_file(file_path: Path) -> list[Task]:
         raise FileNotFoundError(f"File not found: {file_path}")
 
     try:
-        content = file_path.read_text()
+        if pyromark is not None:
+            checkbox_items = _extract_checkbox_items_native(file_path.read_text(encoding="utf-8"))
+        else:
+            # Stream the file line by line instead of materializing the whole
+            # content (and a second list of lines) in memory.
+            with file_path.open(encoding="utf-8") as f:
+                checkbox_items = list(_iter_checkbox_items(f))
     except PermissionError as e:
         raise PermissionError(f"Cannot read file: {file_path}") from e
 
-    checkbox_items = extract_checkbox_items(content)
     tasks = []
 
     for title, is_completed in checkbox_items:
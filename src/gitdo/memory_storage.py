@@ -0,0 +1,75 @@
+"""In-memory storage for GitDo."""
+
+from pathlib import Path
+
+from .models import Task
+from .storage import Storage
+
+
+class InMemoryStorage(Storage):
+    """Task storage that never touches disk.
+
+    Tasks live as raw dictionaries on the instance, so the full Storage
+    interface works without any file I/O. State lasts only as long as the
+    instance, so this backend is for tests that exercise storage-facing
+    behaviour without caring about persistence; it is deliberately not
+    selectable through GITDO_STORAGE, since separate CLI invocations
+    would each get an empty store. Construct it directly instead.
+    """
+
+    def __init__(self, base_path: Path | None = None):
+        """Initialize in-memory storage.
+
+        Args:
+            base_path: Accepted for interface compatibility; no files are
+                      created under it.
+        """
+        super().__init__(base_path)
+        # None until init(), mirroring a missing tasks.json on disk.
+        self._raw: list[dict] | None = None
+
+    def init(self) -> None:
+        """Initialize the in-memory task list."""
+        if self._raw is None:
+            self._raw = []
+
+    def is_initialized(self) -> bool:
+        """Check if the in-memory task list exists."""
+        return self._raw is not None
+
+    def load_tasks(self) -> list[Task]:
+        """Load all tasks from memory.
+
+        Returns:
+            List of tasks
+        """
+        tasks = [Task.from_dict(task_data) for task_data in self._raw or []]
+        self._build_prefix_index(tasks)
+        return tasks
+
+    def _load_raw(self) -> list[dict]:
+        """Load tasks as raw dictionaries from memory.
+
+        Returns:
+            List of task dictionaries
+        """
+        return list(self._raw) if self._raw else []
+
+    def _save_tasks(self, tasks: list[Task]) -> None:
+        """Save tasks to memory.
+
+        Args:
+            tasks: List of tasks to save
+        """
+        self._raw = [task.to_dict() for task in tasks]
+        self._build_prefix_index(tasks)
+
+    def _save_tasks_raw(self, raw_tasks: list[dict], *, background: bool = False) -> None:
+        """Save raw task dictionaries to memory.
+
+        Args:
+            raw_tasks: List of task dictionaries to save
+            background: Ignored; in-memory saves are instant
+        """
+        self._raw = list(raw_tasks)
+        self._by_prefix = None
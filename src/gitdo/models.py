@@ -13,7 +13,7 @@ class TaskStatus(str, Enum):
     COMPLETED = "completed"
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """Task model."""
 
@@ -22,6 +22,9 @@ class Task:
     status: TaskStatus = TaskStatus.PENDING
     created_at: datetime = field(default_factory=datetime.now)
     completed_at: datetime | None = None
+    # created_at never changes after construction, so its isoformat string
+    # is computed at most once per task.
+    _created_iso: str | None = field(default=None, init=False, repr=False, compare=False)
 
     def start(self) -> None:
         """Mark task as in progress."""
@@ -34,18 +37,20 @@ class Task:
 
     def to_dict(self) -> dict:
         """Convert task to dictionary."""
+        if self._created_iso is None:
+            self._created_iso = self.created_at.isoformat()
         return {
             "id": self.id,
             "title": self.title,
             "status": self.status.value,
-            "created_at": self.created_at.isoformat(),
+            "created_at": self._created_iso,
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
         }
 
     @classmethod
     def from_dict(cls, data: dict) -> "Task":
         """Create task from dictionary."""
-        return cls(
+        task = cls(
             id=data["id"],
             title=data["title"],
             status=TaskStatus(data["status"]),
@@ -54,3 +59,5 @@ class Task:
             if data.get("completed_at")
             else None,
         )
+        task._created_iso = data["created_at"]
+        return task
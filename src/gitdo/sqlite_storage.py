@@ -0,0 +1,290 @@
+"""SQLite-backed storage for GitDo."""
+
+import sqlite3
+from pathlib import Path
+from uuid import uuid4
+
+from .models import Task, TaskStatus
+from .storage import Storage
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    status TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    completed_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_prefix ON tasks(substr(id, 1, 8));
+"""
+
+
+class SqliteStorage(Storage):
+    """Handle task storage in an SQLite database under .gitdo/.
+
+    Same public interface as Storage, but mutations touch single rows
+    instead of rewriting the whole task file, which keeps commands fast
+    on large task stores. Select it with ``GITDO_STORAGE=sqlite``.
+    """
+
+    def __init__(self, base_path: Path | None = None):
+        """Initialize SQLite storage.
+
+        Args:
+            base_path: Base path for storage. If None, searches for .gitdo/
+                      by walking up from current directory.
+        """
+        super().__init__(base_path)
+        self.db_file = self.storage_dir / "tasks.db"
+        self._conn: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return the open database connection, creating it on first use."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_file)
+        return self._conn
+
+    def init(self) -> None:
+        """Initialize .gitdo folder and the tasks database."""
+        self.storage_dir.mkdir(exist_ok=True)
+        conn = self._connect()
+        conn.executescript(_SCHEMA)
+        self._migrate_from_json(conn)
+        conn.commit()
+
+    def is_initialized(self) -> bool:
+        """Check if the tasks database exists."""
+        return self.db_file.exists()
+
+    def _migrate_from_json(self, conn: sqlite3.Connection) -> None:
+        """Import tasks from an existing tasks.json into an empty database."""
+        if not self.tasks_file.exists():
+            return
+        if conn.execute("SELECT 1 FROM tasks LIMIT 1").fetchone() is not None:
+            return
+        conn.executemany(
+            "INSERT OR IGNORE INTO tasks VALUES (?, ?, ?, ?, ?)",
+            [
+                (d["id"], d["title"], d["status"], d["created_at"], d.get("completed_at"))
+                for d in self._load_raw()
+            ],
+        )
+
+    @staticmethod
+    def _row_to_task(row: tuple) -> Task:
+        """Build a Task from a database row."""
+        return Task.from_dict(
+            {
+                "id": row[0],
+                "title": row[1],
+                "status": row[2],
+                "created_at": row[3],
+                "completed_at": row[4],
+            }
+        )
+
+    def _resolve_id(self, task_id: str) -> str | None:
+        """Resolve a full ID or ID prefix to the stored task ID."""
+        conn = self._connect()
+        # Escape LIKE wildcards so the prefix matches literally, same as
+        # the JSON backend's startswith; a bare "%" must not match a row.
+        pattern = task_id.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        if len(task_id) >= 8:
+            # The substr index serves the common short-ID lookup.
+            row = conn.execute(
+                "SELECT id FROM tasks WHERE substr(id, 1, 8) = ? AND id LIKE ? ESCAPE '\\' LIMIT 1",
+                (task_id[:8], pattern),
+            ).fetchone()
+        else:
+            row = conn.execute(
+                "SELECT id FROM tasks WHERE id LIKE ? ESCAPE '\\' LIMIT 1", (pattern,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def add_task(self, title: str) -> Task:
+        """Add a new task.
+
+        Args:
+            title: Task title
+
+        Returns:
+            Created task
+        """
+        task = Task(id=str(uuid4()), title=title)
+        conn = self._connect()
+        data = task.to_dict()
+        conn.execute(
+            "INSERT INTO tasks VALUES (?, ?, ?, ?, ?)",
+            (data["id"], data["title"], data["status"], data["created_at"], data["completed_at"]),
+        )
+        conn.commit()
+        return task
+
+    def add_tasks(self, titles: list[str]) -> list[Task]:
+        """Add multiple tasks in one insert batch.
+
+        Args:
+            titles: Task titles
+
+        Returns:
+            List of created tasks
+        """
+        created = [Task(id=str(uuid4()), title=title) for title in titles]
+        conn = self._connect()
+        conn.executemany(
+            "INSERT INTO tasks VALUES (?, ?, ?, ?, ?)",
+            [
+                (d["id"], d["title"], d["status"], d["created_at"], d["completed_at"])
+                for d in (task.to_dict() for task in created)
+            ],
+        )
+        conn.commit()
+        return created
+
+    def load_tasks(self) -> list[Task]:
+        """Load all tasks from storage.
+
+        Returns:
+            List of tasks
+        """
+        if not self.is_initialized():
+            return []
+        rows = self._connect().execute(
+            "SELECT id, title, status, created_at, completed_at FROM tasks"
+        )
+        return [self._row_to_task(row) for row in rows]
+
+    def load_task_rows(self) -> list[tuple[str, str, str, str]]:
+        """Load tasks as display rows straight from the database.
+
+        Returns:
+            List of (id, title, status, created_at_iso) tuples
+        """
+        if not self.is_initialized():
+            return []
+        return list(self._connect().execute("SELECT id, title, status, created_at FROM tasks"))
+
+    def get_task(self, task_id: str) -> Task | None:
+        """Get task by ID.
+
+        Args:
+            task_id: Task ID
+
+        Returns:
+            Task if found, None otherwise
+        """
+        full_id = self._resolve_id(task_id)
+        if full_id is None:
+            return None
+        row = (
+            self._connect()
+            .execute(
+                "SELECT id, title, status, created_at, completed_at FROM tasks WHERE id = ?",
+                (full_id,),
+            )
+            .fetchone()
+        )
+        return self._row_to_task(row)
+
+    def start_task(self, task_id: str) -> bool:
+        """Mark task as in progress.
+
+        Args:
+            task_id: Task ID
+
+        Returns:
+            True if task was found and started, False otherwise
+        """
+        return self._update_status(task_id, TaskStatus.INPROGRESS)
+
+    def complete_task(self, task_id: str) -> bool:
+        """Mark task as completed.
+
+        Args:
+            task_id: Task ID
+
+        Returns:
+            True if task was found and completed, False otherwise
+        """
+        return self._update_status(task_id, TaskStatus.COMPLETED)
+
+    def _update_status(self, task_id: str, status: TaskStatus) -> bool:
+        """Set the status of the task matching a full ID or ID prefix."""
+        full_id = self._resolve_id(task_id)
+        if full_id is None:
+            return False
+        task = self.get_task(full_id)
+        if status is TaskStatus.COMPLETED:
+            task.complete()
+        else:
+            task.start()
+        data = task.to_dict()
+        conn = self._connect()
+        conn.execute(
+            "UPDATE tasks SET status = ?, completed_at = ? WHERE id = ?",
+            (data["status"], data["completed_at"], full_id),
+        )
+        conn.commit()
+        return True
+
+    def remove_task(self, task_id: str) -> bool:
+        """Remove task.
+
+        Args:
+            task_id: Task ID
+
+        Returns:
+            True if task was found and removed, False otherwise
+        """
+        full_id = self._resolve_id(task_id)
+        if full_id is None:
+            return False
+        conn = self._connect()
+        conn.execute("DELETE FROM tasks WHERE id = ?", (full_id,))
+        conn.commit()
+        return True
+
+    def import_tasks(
+        self,
+        tasks: list[Task],
+        *,
+        skip_duplicates: bool = False,
+    ) -> tuple[int, int]:
+        """Import multiple tasks at once.
+
+        Args:
+            tasks: List of tasks to import
+            skip_duplicates: If True, skip tasks with duplicate titles
+
+        Returns:
+            Tuple of (imported_count, skipped_count)
+        """
+        conn = self._connect()
+        existing_hashes = (
+            {hash(row[0]) for row in conn.execute("SELECT title FROM tasks")}
+            if skip_duplicates
+            else set()
+        )
+
+        rows = []
+        skipped_count = 0
+        for task in tasks:
+            title_hash = hash(task.title)
+            if skip_duplicates and title_hash in existing_hashes:
+                skipped_count += 1
+                continue
+            data = task.to_dict()
+            rows.append(
+                (
+                    data["id"],
+                    data["title"],
+                    data["status"],
+                    data["created_at"],
+                    data["completed_at"],
+                )
+            )
+            existing_hashes.add(title_hash)
+
+        conn.executemany("INSERT INTO tasks VALUES (?, ?, ?, ?, ?)", rows)
+        conn.commit()
+        return len(rows), skipped_count
@@ -1,11 +1,47 @@
 """Storage handling for GitDo."""
 
-import json
+import atexit
+import os
+import stat
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from uuid import uuid4
 
+import orjson
+
 from .models import Task
 
+# Length of the short task ID prefix printed by the CLI.
+ID_PREFIX_LEN = 8
+
+# Single worker so background saves to tasks.json stay ordered.
+_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+atexit.register(_EXECUTOR.shutdown, wait=True)
+
+
+def get_storage(base_path: Path | None = None) -> "Storage":
+    """Create the storage backend selected by the GITDO_STORAGE env var.
+
+    Supported values: "json" (the default), "jsonl" and "sqlite".
+
+    Args:
+        base_path: Base path for storage, forwarded to the backend
+
+    Returns:
+        Storage instance of the selected backend
+    """
+    backend = os.environ.get("GITDO_STORAGE", "json").lower()
+    if backend == "sqlite":
+        from .sqlite_storage import SqliteStorage
+
+        return SqliteStorage(base_path)
+    if backend == "jsonl":
+        from .jsonl_storage import JsonlStorage
+
+        return JsonlStorage(base_path)
+    return Storage(base_path)
+
 
 class Storage:
     """Handle task storage in .gitdo/ folder."""
@@ -23,6 +59,14 @@ class Storage:
             self.base_path = base_path
         self.storage_dir = self.base_path / ".gitdo"
         self.tasks_file = self.storage_dir / "tasks.json"
+        # In-process cache of the parsed task list, keyed by file stat so
+        # external modifications to tasks.json are still picked up.
+        self._cache: list[Task] | None = None
+        self._cache_stat: tuple[int, int] | None = None
+        # Short-ID-prefix -> task list indices, rebuilt with the cache.
+        self._by_prefix: dict[str, list[int]] | None = None
+        # Outstanding background save, if any.
+        self._pending_write: Future | None = None
 
     @staticmethod
     def _find_gitdo_root(start_path: Path | None = None) -> Path | None:
@@ -39,11 +83,16 @@ class Storage:
         current = start_path or Path.cwd()
         current = current.resolve()
 
-        # Walk up the directory tree until we find .gitdo or reach root
+        # Walk up the directory tree until we find .gitdo or reach root.
+        # One os.stat per ancestor instead of separate exists()/is_dir() calls.
         while True:
-            gitdo_path = current / ".gitdo"
-            if gitdo_path.exists() and gitdo_path.is_dir():
-                return current
+            try:
+                gitdo_stat = os.stat(current / ".gitdo")
+            except OSError:
+                pass
+            else:
+                if stat.S_ISDIR(gitdo_stat.st_mode):
+                    return current
 
             parent = current.parent
             # Check if we've reached the filesystem root
@@ -59,7 +108,13 @@ class Storage:
 
     def is_initialized(self) -> bool:
         """Check if .gitracker folder exists."""
-        return self.storage_dir.exists() and self.tasks_file.exists()
+        # tasks.json existing implies the .gitdo directory does too, so a
+        # single stat answers both checks.
+        try:
+            os.stat(self.tasks_file)
+        except OSError:
+            return False
+        return True
 
     def add_task(self, title: str) -> Task:
         """Add a new task.
@@ -76,18 +131,58 @@ class Storage:
         self._save_tasks(tasks)
         return task
 
+    def add_tasks(self, titles: list[str]) -> list[Task]:
+        """Add multiple tasks in one load/save cycle.
+
+        Args:
+            titles: Task titles
+
+        Returns:
+            List of created tasks
+        """
+        tasks = self.load_tasks()
+        created = [Task(id=str(uuid4()), title=title) for title in titles]
+        tasks.extend(created)
+        self._save_tasks(tasks)
+        return created
+
     def load_tasks(self) -> list[Task]:
         """Load all tasks from storage.
 
         Returns:
             List of tasks
         """
-        if not self.tasks_file.exists():
+        self.flush()
+        try:
+            file_stat = os.stat(self.tasks_file)
+        except FileNotFoundError:
             return []
 
-        with open(self.tasks_file) as f:
-            data = json.load(f)
-            return [Task.from_dict(task_data) for task_data in data]
+        stat_key = (file_stat.st_mtime_ns, file_stat.st_size)
+        if self._cache is not None and stat_key == self._cache_stat:
+            return list(self._cache)
+
+        data = orjson.loads(self.tasks_file.read_bytes())
+        tasks = [Task.from_dict(task_data) for task_data in data]
+        self._cache = tasks
+        self._cache_stat = stat_key
+        self._build_prefix_index(tasks)
+        # Return a shallow copy so caller mutations don't corrupt the cache
+        return list(tasks)
+
+    def load_task_rows(self) -> list[tuple[str, str, str, str]]:
+        """Load tasks as display rows, without constructing Task objects.
+
+        Listing only re-serializes what was parsed, so keep the stored
+        strings as-is and skip the datetime roundtrip entirely.
+
+        Returns:
+            List of (id, title, status, created_at_iso) tuples
+        """
+        return [
+            (task_data["id"], task_data["title"], task_data["status"], task_data["created_at"])
+            for task_data in self._load_raw()
+        ]
 
     def get_task(self, task_id: str) -> Task | None:
         """Get task by ID.
@@ -99,9 +194,37 @@ class Storage:
             Task if found, None otherwise
         """
         tasks = self.load_tasks()
-        for task in tasks:
+        index = self._find_task_index(tasks, task_id)
+        return tasks[index] if index is not None else None
+
+    def _build_prefix_index(self, tasks: list[Task]) -> None:
+        """Rebuild the short-ID-prefix index for the given task list."""
+        by_prefix: dict[str, list[int]] = defaultdict(list)
+        for i, task in enumerate(tasks):
+            by_prefix[task.id[:ID_PREFIX_LEN]].append(i)
+        self._by_prefix = by_prefix
+
+    def _find_task_index(self, tasks: list[Task], task_id: str) -> int | None:
+        """Find the index of the task matching a full ID or ID prefix.
+
+        Args:
+            tasks: Task list as returned by load_tasks
+            task_id: Full task ID or a prefix of it
+
+        Returns:
+            Index into ``tasks``, or None if no task matches
+        """
+        # The index only helps when we have at least the printed short
+        # prefix; shorter prefixes fall back to a linear scan.
+        if self._by_prefix is not None and len(task_id) >= ID_PREFIX_LEN:
+            for i in self._by_prefix.get(task_id[:ID_PREFIX_LEN], ()):
+                if tasks[i].id.startswith(task_id):
+                    return i
+            return None
+
+        for i, task in enumerate(tasks):
             if task.id.startswith(task_id):
-                return task
+                return i
         return None
 
     def start_task(self, task_id: str) -> bool:
@@ -114,12 +237,12 @@ class Storage:
             True if task was found and started, False otherwise
         """
         tasks = self.load_tasks()
-        for task in tasks:
-            if task.id.startswith(task_id):
-                task.start()
-                self._save_tasks(tasks)
-                return True
-        return False
+        index = self._find_task_index(tasks, task_id)
+        if index is None:
+            return False
+        tasks[index].start()
+        self._save_tasks(tasks)
+        return True
 
     def complete_task(self, task_id: str) -> bool:
         """Mark task as completed.
@@ -131,12 +254,12 @@ class Storage:
             True if task was found and completed, False otherwise
         """
         tasks = self.load_tasks()
-        for task in tasks:
-            if task.id.startswith(task_id):
-                task.complete()
-                self._save_tasks(tasks)
-                return True
-        return False
+        index = self._find_task_index(tasks, task_id)
+        if index is None:
+            return False
+        tasks[index].complete()
+        self._save_tasks(tasks)
+        return True
 
     def remove_task(self, task_id: str) -> bool:
         """Remove task.
@@ -148,12 +271,16 @@ class Storage:
             True if task was found and removed, False otherwise
         """
         tasks = self.load_tasks()
-        for i, task in enumerate(tasks):
-            if task.id.startswith(task_id):
-                tasks.pop(i)
-                self._save_tasks(tasks)
-                return True
-        return False
+        index = self._find_task_index(tasks, task_id)
+        if index is None:
+            return False
+        # Swap with the last element before popping: O(1) instead of the
+        # O(N) memmove of list.pop(i). Task order is not contractual; the
+        # CLI re-sorts on display.
+        tasks[index] = tasks[-1]
+        tasks.pop()
+        self._save_tasks(tasks)
+        return True
 
     def import_tasks(
         self,
@@ -170,29 +297,97 @@ class Storage:
         Returns:
             Tuple of (imported_count, skipped_count)
         """
-        existing_tasks = self.load_tasks()
-        existing_titles = {task.title for task in existing_tasks} if skip_duplicates else set()
+        # Work on raw dicts: deduplication only needs titles, so skip
+        # constructing Task objects (and parsing datetimes) for existing rows.
+        # Dedup on 64-bit title hashes rather than the strings themselves so
+        # the set stays small even when titles are long.
+        raw_tasks = self._load_raw()
+        existing_hashes = (
+            {hash(task_data["title"]) for task_data in raw_tasks} if skip_duplicates else set()
+        )
 
         imported_count = 0
         skipped_count = 0
 
         for task in tasks:
-            if skip_duplicates and task.title in existing_titles:
+            title_hash = hash(task.title)
+            if skip_duplicates and title_hash in existing_hashes:
                 skipped_count += 1
                 continue
 
-            existing_tasks.append(task)
-            existing_titles.add(task.title)
+            raw_tasks.append(task.to_dict())
+            existing_hashes.add(title_hash)
             imported_count += 1
 
-        self._save_tasks(existing_tasks)
+        # Write in the background so callers can render results while the
+        # payload reaches disk; reads and flush() synchronize with it.
+        self._save_tasks_raw(raw_tasks, background=True)
         return imported_count, skipped_count
 
+    def flush(self) -> None:
+        """Wait for any outstanding background save to reach disk."""
+        if self._pending_write is not None:
+            pending, self._pending_write = self._pending_write, None
+            pending.result()
+
+    def _write_payload(self, payload: bytes) -> None:
+        """Atomically replace tasks.json with the serialized payload.
+
+        Writes to a temporary file in the same directory, syncs it, then
+        renames over tasks.json so a crash mid-write can never leave a
+        torn file behind.
+
+        Args:
+            payload: Serialized JSON bytes
+        """
+        tmp_file = self.tasks_file.with_suffix(".json.tmp")
+        with open(tmp_file, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.tasks_file)
+
+    def _load_raw(self) -> list[dict]:
+        """Load tasks as raw dictionaries, without constructing Task objects.
+
+        Returns:
+            List of task dictionaries
+        """
+        self.flush()
+        if not self.tasks_file.exists():
+            return []
+
+        return orjson.loads(self.tasks_file.read_bytes())
+
     def _save_tasks(self, tasks: list[Task]) -> None:
         """Save tasks to storage.
 
         Args:
             tasks: List of tasks to save
         """
-        with open(self.tasks_file, "w") as f:
-            json.dump([task.to_dict() for task in tasks], f, indent=2)
+        payload = orjson.dumps([task.to_dict() for task in tasks], option=orjson.OPT_INDENT_2)
+        self._write_payload(payload)
+
+        file_stat = os.stat(self.tasks_file)
+        self._cache = list(tasks)
+        self._cache_stat = (file_stat.st_mtime_ns, file_stat.st_size)
+        self._build_prefix_index(self._cache)
+
+    def _save_tasks_raw(self, raw_tasks: list[dict], *, background: bool = False) -> None:
+        """Save raw task dictionaries to storage.
+
+        Args:
+            raw_tasks: List of task dictionaries to save
+            background: If True, hand the disk write to the worker thread
+        """
+        payload = orjson.dumps(raw_tasks, option=orjson.OPT_INDENT_2)
+
+        # The parsed cache no longer matches the file; drop it.
+        self._cache = None
+        self._cache_stat = None
+        self._by_prefix = None
+
+        if background:
+            self._pending_write = _EXECUTOR.submit(self._write_payload, payload)
+        else:
+            self._write_payload(payload)
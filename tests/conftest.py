@@ -1,5 +1,6 @@
 """Pytest configuration and fixtures."""
 
+import shutil
 import tempfile
 from pathlib import Path
 
@@ -21,8 +22,104 @@ def storage(temp_dir):
     return Storage(base_path=temp_dir)
 
 
+@pytest.fixture(scope="session")
+def _storage_template(tmp_path_factory):
+    """Run storage init once; per-test fixtures clone the result."""
+    template = tmp_path_factory.mktemp("storage-template")
+    Storage(base_path=template).init()
+    return template
+
+
 @pytest.fixture
-def initialized_storage(storage):
+def initialized_storage(temp_dir, _storage_template):
     """Create and initialize a storage instance."""
-    storage.init()
-    return storage
+    shutil.copytree(_storage_template / ".gitdo", temp_dir / ".gitdo")
+    return Storage(base_path=temp_dir)
+
+
+@pytest.fixture(scope="session")
+def basic_md(tmp_path_factory):
+    """Markdown file with three checkbox items, written once per session."""
+    path = tmp_path_factory.mktemp("md-basic") / "tasks.md"
+    path.write_text("""
+# Tasks
+
+- [ ] Task 1
+- [x] Task 2
+- [ ] Task 3
+""")
+    return path
+
+
+@pytest.fixture(scope="session")
+def complex_md(tmp_path_factory):
+    """Markdown file with nested checkbox items and prose, written once per session."""
+    path = tmp_path_factory.mktemp("md-complex") / "complex.md"
+    path.write_text("""
+# Project Tasks
+
+## Phase 1
+- [x] Setup project
+- [ ] Write docs
+
+## Phase 2
+- [ ] Implement feature A
+  - [ ] Sub-task 1
+  - [ ] Sub-task 2
+- [ ] Implement feature B
+
+Some random text here.
+
+## Phase 3
+- [ ] Deploy to production
+""")
+    return path
+
+
+@pytest.fixture(scope="session")
+def project_md(tmp_path_factory):
+    """Markdown file with eleven checkbox items, written once per session.
+
+    Includes a completed checkbox nested two levels deep, which the
+    parser tests rely on.
+    """
+    path = tmp_path_factory.mktemp("md-project") / "project.md"
+    path.write_text("""
+# GitDo Project
+
+## Phase 1 - Setup
+- [x] Initialize repository
+- [x] Setup project structure
+- [ ] Configure CI/CD
+
+## Phase 2 - Core Features
+- [ ] Implement task storage
+  - [ ] Add JSON persistence
+  - [ ] Add file discovery
+- [ ] Create CLI interface
+  - [x] Add init command
+  - [ ] Add list command
+
+## Phase 3 - Advanced
+- [ ] Add markdown import
+- [ ] Add task filtering
+""")
+    return path
+
+
+@pytest.fixture
+def bootstrap():
+    """Initialize storage in the current directory and seed tasks directly.
+
+    CLI tests use this for setup so runner.invoke is reserved for the one
+    command actually under test.
+    """
+
+    def _bootstrap(titles=()):
+        storage = Storage(base_path=Path.cwd())
+        storage.init()
+        if titles:
+            storage.add_tasks(list(titles))
+        return storage
+
+    return _bootstrap
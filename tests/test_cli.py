@@ -1,14 +1,20 @@
 """Tests for CLI interface."""
 
+import json
+
 import pytest
 from click.testing import CliRunner
 
-from gitdo.cli import cli
+from gitdo.cli import LIST_CHUNK_SIZE, cli
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def runner():
-    """Create a CLI runner."""
+    """Create a CLI runner, shared across the session.
+
+    CliRunner holds no per-test state; isolation comes from each test
+    chdir-ing into its own tmp_path.
+    """
     return CliRunner()
 
 
@@ -19,175 +25,188 @@ def test_cli_version(runner):
     assert "version" in result.output.lower()
 
 
-def test_init_command(runner):
+def test_init_command(runner, tmp_path, monkeypatch):
     """Test init command."""
-    with runner.isolated_filesystem():
-        result = runner.invoke(cli, ["init"])
-        assert result.exit_code == 0
-        assert "initialized successfully" in result.output.lower()
+    monkeypatch.chdir(tmp_path)
+    result = runner.invoke(cli, ["init"])
+    assert result.exit_code == 0
+    assert "initialized successfully" in result.output.lower()
 
 
-def test_init_already_initialized(runner):
+def test_init_already_initialized(runner, tmp_path, monkeypatch):
     """Test init command when already initialized."""
-    with runner.isolated_filesystem():
-        runner.invoke(cli, ["init"])
-        result = runner.invoke(cli, ["init"])
-        assert result.exit_code == 0
-        assert "already initialized" in result.output.lower()
+    monkeypatch.chdir(tmp_path)
+    runner.invoke(cli, ["init"])
+    result = runner.invoke(cli, ["init"])
+    assert result.exit_code == 0
+    assert "already initialized" in result.output.lower()
 
 
-def test_add_command(runner):
+def test_add_command(runner, bootstrap, tmp_path, monkeypatch):
     """Test add command."""
-    with runner.isolated_filesystem():
-        runner.invoke(cli, ["init"])
-        result = runner.invoke(cli, ["add", "Test task"])
-        assert result.exit_code == 0
-        assert "added task" in result.output.lower()
+    monkeypatch.chdir(tmp_path)
+    bootstrap()
+    result = runner.invoke(cli, ["add", "Test task"])
+    assert result.exit_code == 0
+    assert "added task" in result.output.lower()
 
 
-def test_add_without_init(runner):
+def test_add_json_output(runner, bootstrap, tmp_path, monkeypatch):
+    """Test add command with --json flag for machine-readable output."""
+    monkeypatch.chdir(tmp_path)
+    storage = bootstrap()
+    result = runner.invoke(cli, ["add", "Test task", "--json"])
+    assert result.exit_code == 0
+
+    data = json.loads(result.output)
+    assert data["title"] == "Test task"
+    assert data["id"] == storage.load_tasks()[0].id
+
+
+def test_add_without_init(runner, tmp_path, monkeypatch):
     """Test add command without initialization."""
-    with runner.isolated_filesystem():
-        result = runner.invoke(cli, ["add", "Test task"])
-        assert result.exit_code != 0
-        assert "not initialized" in result.output.lower()
+    monkeypatch.chdir(tmp_path)
+    result = runner.invoke(cli, ["add", "Test task"])
+    assert result.exit_code != 0
+    assert "not initialized" in result.output.lower()
 
 
-def test_list_command(runner):
+def test_list_command(runner, bootstrap, tmp_path, monkeypatch):
     """Test list command."""
-    with runner.isolated_filesystem():
-        runner.invoke(cli, ["init"])
-        runner.invoke(cli, ["add", "Task 1"])
-        runner.invoke(cli, ["add", "Task 2"])
+    monkeypatch.chdir(tmp_path)
+    bootstrap(["Task 1", "Task 2"])
 
-        result = runner.invoke(cli, ["list"])
-        assert result.exit_code == 0
-        assert "Task 1" in result.output
-        assert "Task 2" in result.output
+    result = runner.invoke(cli, ["list"])
+    assert result.exit_code == 0
+    assert "Task 1" in result.output
+    assert "Task 2" in result.output
 
 
-def test_list_empty(runner):
+def test_list_empty(runner, bootstrap, tmp_path, monkeypatch):
     """Test list command with no tasks."""
-    with runner.isolated_filesystem():
-        runner.invoke(cli, ["init"])
-        result = runner.invoke(cli, ["list"])
-        assert result.exit_code == 0
-        assert "no tasks" in result.output.lower()
+    monkeypatch.chdir(tmp_path)
+    bootstrap()
+    result = runner.invoke(cli, ["list"])
+    assert result.exit_code == 0
+    assert "no tasks" in result.output.lower()
+
 
+def test_list_chunked_output_stays_aligned(runner, bootstrap, tmp_path, monkeypatch):
+    """Test that lists crossing LIST_CHUNK_SIZE render as aligned chunks."""
+    monkeypatch.chdir(tmp_path)
+    bootstrap([f"Task {i}" for i in range(LIST_CHUNK_SIZE + 5)])
+
+    result = runner.invoke(cli, ["list"])
+    assert result.exit_code == 0
+    assert "Task 0" in result.output
+    assert f"Task {LIST_CHUNK_SIZE + 4}" in result.output
 
-def test_list_without_init(runner):
+    # Every chunk must share one geometry: same overall width and the
+    # column separators in the same positions on every row.
+    lines = [line for line in result.output.splitlines() if line.strip()]
+    assert len({len(line) for line in lines}) == 1
+    separator_layouts = {
+        tuple(i for i, char in enumerate(line) if char == "│") for line in lines if "│" in line
+    }
+    assert len(separator_layouts) == 1
+
+
+def test_list_without_init(runner, tmp_path, monkeypatch):
     """Test list command without initialization."""
-    with runner.isolated_filesystem():
-        result = runner.invoke(cli, ["list"])
-        assert result.exit_code != 0
-        assert "not initialized" in result.output.lower()
+    monkeypatch.chdir(tmp_path)
+    result = runner.invoke(cli, ["list"])
+    assert result.exit_code != 0
+    assert "not initialized" in result.output.lower()
 
 
-def test_complete_command(runner):
+def test_complete_command(runner, bootstrap, tmp_path, monkeypatch):
     """Test complete command."""
-    with runner.isolated_filesystem():
-        runner.invoke(cli, ["init"])
-        add_result = runner.invoke(cli, ["add", "Test task"])
+    monkeypatch.chdir(tmp_path)
+    storage = bootstrap(["Test task"])
+    task_id = storage.load_tasks()[0].id[:8]
 
-        # Extract task ID from output (first 8 characters of UUID)
-        task_id = add_result.output.split("ID: ")[1].split("\n")[0]
-
-        result = runner.invoke(cli, ["complete", task_id])
-        assert result.exit_code == 0
-        assert "marked as completed" in result.output.lower()
+    result = runner.invoke(cli, ["complete", task_id])
+    assert result.exit_code == 0
+    assert "marked as completed" in result.output.lower()
 
 
-def test_complete_nonexistent_task(runner):
+def test_complete_nonexistent_task(runner, bootstrap, tmp_path, monkeypatch):
     """Test complete command with non-existent task."""
-    with runner.isolated_filesystem():
-        runner.invoke(cli, ["init"])
-        result = runner.invoke(cli, ["complete", "nonexistent"])
-        assert result.exit_code != 0
-        assert "not found" in result.output.lower()
+    monkeypatch.chdir(tmp_path)
+    bootstrap()
+    result = runner.invoke(cli, ["complete", "nonexistent"])
+    assert result.exit_code != 0
+    assert "not found" in result.output.lower()
 
 
-def test_remove_command(runner):
+def test_remove_command(runner, bootstrap, tmp_path, monkeypatch):
     """Test remove command."""
-    with runner.isolated_filesystem():
-        runner.invoke(cli, ["init"])
-        add_result = runner.invoke(cli, ["add", "Test task"])
-
-        # Extract task ID from output
-        task_id = add_result.output.split("ID: ")[1].split("\n")[0]
+    monkeypatch.chdir(tmp_path)
+    storage = bootstrap(["Test task"])
+    task_id = storage.load_tasks()[0].id[:8]
 
-        result = runner.invoke(cli, ["remove", task_id])
-        assert result.exit_code == 0
-        assert "removed" in result.output.lower()
+    result = runner.invoke(cli, ["remove", task_id])
+    assert result.exit_code == 0
+    assert "removed" in result.output.lower()
 
 
-def test_remove_nonexistent_task(runner):
+def test_remove_nonexistent_task(runner, bootstrap, tmp_path, monkeypatch):
     """Test remove command with non-existent task."""
-    with runner.isolated_filesystem():
-        runner.invoke(cli, ["init"])
-        result = runner.invoke(cli, ["remove", "nonexistent"])
-        assert result.exit_code != 0
-        assert "not found" in result.output.lower()
+    monkeypatch.chdir(tmp_path)
+    bootstrap()
+    result = runner.invoke(cli, ["remove", "nonexistent"])
+    assert result.exit_code != 0
+    assert "not found" in result.output.lower()
 
 
-def test_list_all_flag(runner):
+def test_list_all_flag(runner, bootstrap, tmp_path, monkeypatch):
     """Test list command with --all flag."""
-    with runner.isolated_filesystem():
-        runner.invoke(cli, ["init"])
-        add_result = runner.invoke(cli, ["add", "Test task"])
-        task_id = add_result.output.split("ID: ")[1].split("\n")[0]
-        runner.invoke(cli, ["complete", task_id])
+    monkeypatch.chdir(tmp_path)
+    storage = bootstrap(["Test task"])
+    storage.complete_task(storage.load_tasks()[0].id)
 
-        # Without --all, completed tasks should not be shown
-        result = runner.invoke(cli, ["list"])
-        assert "Test task" not in result.output
+    # Without --all, completed tasks should not be shown
+    result = runner.invoke(cli, ["list"])
+    assert "Test task" not in result.output
 
-        # With --all, completed tasks should be shown
-        result = runner.invoke(cli, ["list", "--all"])
-        assert "Test task" in result.output
-        assert "completed" in result.output.lower()
+    # With --all, completed tasks should be shown
+    result = runner.invoke(cli, ["list", "--all"])
+    assert "Test task" in result.output
+    assert "completed" in result.output.lower()
 
 
-def test_import_md_basic(runner, tmp_path):
+def test_import_md_basic(runner, bootstrap, basic_md, tmp_path, monkeypatch):
     """Test import-md command with basic markdown file."""
-    md_file = tmp_path / "tasks.md"
-    md_file.write_text("""
-# Tasks
-
-- [ ] Task 1
-- [x] Task 2
-- [ ] Task 3
-""")
-
-    with runner.isolated_filesystem():
-        runner.invoke(cli, ["init"])
-        result = runner.invoke(cli, ["import-md", str(md_file)])
-        assert result.exit_code == 0
-        assert "Imported 3 task(s)" in result.output
-        assert "Task 1" in result.output
-        assert "Task 2" in result.output
-        assert "Task 3" in result.output
+    monkeypatch.chdir(tmp_path)
+    bootstrap()
+    result = runner.invoke(cli, ["import-md", str(basic_md)])
+    assert result.exit_code == 0
+    assert "Imported 3 task(s)" in result.output
+    assert "Task 1" in result.output
+    assert "Task 2" in result.output
+    assert "Task 3" in result.output
 
 
-def test_import_md_without_init(runner, tmp_path):
+def test_import_md_without_init(runner, tmp_path, monkeypatch):
     """Test import-md command without initialization."""
     md_file = tmp_path / "tasks.md"
     md_file.write_text("- [ ] Task 1")
 
-    with runner.isolated_filesystem():
-        result = runner.invoke(cli, ["import-md", str(md_file)])
-        assert result.exit_code != 0
-        assert "not initialized" in result.output.lower()
+    monkeypatch.chdir(tmp_path)
+    result = runner.invoke(cli, ["import-md", str(md_file)])
+    assert result.exit_code != 0
+    assert "not initialized" in result.output.lower()
 
 
-def test_import_md_file_not_found(runner):
+def test_import_md_file_not_found(runner, bootstrap, tmp_path, monkeypatch):
     """Test import-md command with non-existent file."""
-    with runner.isolated_filesystem():
-        runner.invoke(cli, ["init"])
-        result = runner.invoke(cli, ["import-md", "/non/existent/file.md"])
-        assert result.exit_code != 0
+    monkeypatch.chdir(tmp_path)
+    bootstrap()
+    result = runner.invoke(cli, ["import-md", "/non/existent/file.md"])
+    assert result.exit_code != 0
 
 
-def test_import_md_no_checkboxes(runner, tmp_path):
+def test_import_md_no_checkboxes(runner, bootstrap, tmp_path, monkeypatch):
     """Test import-md command with file without checkboxes."""
     md_file = tmp_path / "no_tasks.md"
     md_file.write_text("""
@@ -196,14 +215,14 @@ def test_import_md_no_checkboxes(runner, tmp_path):
 No checkbox items here.
 """)
 
-    with runner.isolated_filesystem():
-        runner.invoke(cli, ["init"])
-        result = runner.invoke(cli, ["import-md", str(md_file)])
-        assert result.exit_code == 0
-        assert "No checkbox items found" in result.output
+    monkeypatch.chdir(tmp_path)
+    bootstrap()
+    result = runner.invoke(cli, ["import-md", str(md_file)])
+    assert result.exit_code == 0
+    assert "No checkbox items found" in result.output
 
 
-def test_import_md_skip_duplicates(runner, tmp_path):
+def test_import_md_skip_duplicates(runner, bootstrap, tmp_path, monkeypatch):
     """Test import-md command with --skip-duplicates flag."""
     md_file = tmp_path / "tasks.md"
     md_file.write_text("""
@@ -211,19 +230,17 @@ def test_import_md_skip_duplicates(runner, tmp_path):
 - [ ] Unique task
 """)
 
-    with runner.isolated_filesystem():
-        runner.invoke(cli, ["init"])
-        # Add a task manually first
-        runner.invoke(cli, ["add", "Duplicate task"])
+    monkeypatch.chdir(tmp_path)
+    bootstrap(["Duplicate task"])
 
-        # Import with skip-duplicates
-        result = runner.invoke(cli, ["import-md", str(md_file), "--skip-duplicates"])
-        assert result.exit_code == 0
-        assert "Imported 1 task(s)" in result.output
-        assert "Skipped 1 duplicate(s)" in result.output
+    # Import with skip-duplicates
+    result = runner.invoke(cli, ["import-md", str(md_file), "--skip-duplicates"])
+    assert result.exit_code == 0
+    assert "Imported 1 task(s)" in result.output
+    assert "Skipped 1 duplicate(s)" in result.output
 
 
-def test_import_md_dry_run(runner, tmp_path):
+def test_import_md_dry_run(runner, bootstrap, tmp_path, monkeypatch):
     """Test import-md command with --dry-run flag."""
     md_file = tmp_path / "tasks.md"
     md_file.write_text("""
@@ -231,55 +248,34 @@ def test_import_md_dry_run(runner, tmp_path):
 - [ ] Task 2
 """)
 
-    with runner.isolated_filesystem():
-        runner.invoke(cli, ["init"])
-        result = runner.invoke(cli, ["import-md", str(md_file), "--dry-run"])
-        assert result.exit_code == 0
-        assert "Task 1" in result.output
-        assert "Task 2" in result.output
-        assert "Dry run - no tasks were imported" in result.output
+    monkeypatch.chdir(tmp_path)
+    storage = bootstrap()
+    result = runner.invoke(cli, ["import-md", str(md_file), "--dry-run"])
+    assert result.exit_code == 0
+    assert "Task 1" in result.output
+    assert "Task 2" in result.output
+    assert "Dry run - no tasks were imported" in result.output
 
-        # Verify tasks were not actually imported
-        list_result = runner.invoke(cli, ["list"])
-        assert "No tasks found" in list_result.output
+    # Verify tasks were not actually imported
+    assert storage.load_tasks() == []
 
 
-def test_import_md_complex_file(runner, tmp_path):
+def test_import_md_complex_file(runner, bootstrap, complex_md, tmp_path, monkeypatch):
     """Test import-md with complex markdown file."""
-    md_file = tmp_path / "complex.md"
-    md_file.write_text("""
-# Project Tasks
-
-## Phase 1
-- [x] Setup project
-- [ ] Write docs
-
-## Phase 2
-- [ ] Implement feature A
-  - [ ] Sub-task 1
-  - [ ] Sub-task 2
-- [ ] Implement feature B
-
-Some random text here.
-
-## Phase 3
-- [ ] Deploy to production
-""")
-
-    with runner.isolated_filesystem():
-        runner.invoke(cli, ["init"])
-        result = runner.invoke(cli, ["import-md", str(md_file)])
-        assert result.exit_code == 0
-        assert "Imported 7 task(s)" in result.output
+    monkeypatch.chdir(tmp_path)
+    storage = bootstrap()
+    result = runner.invoke(cli, ["import-md", str(complex_md)])
+    assert result.exit_code == 0
+    assert "Imported 7 task(s)" in result.output
 
-        # Verify tasks are in storage
-        list_result = runner.invoke(cli, ["list", "--all"])
-        assert "Setup project" in list_result.output
-        assert "Write docs" in list_result.output
-        assert "Deploy to production" in list_result.output
+    # Verify tasks are in storage
+    titles = {task.title for task in storage.load_tasks()}
+    assert "Setup project" in titles
+    assert "Write docs" in titles
+    assert "Deploy to production" in titles
 
 
-def test_import_md_preserves_status(runner, tmp_path):
+def test_import_md_preserves_status(runner, bootstrap, tmp_path, monkeypatch):
     """Test that import-md preserves task status (completed vs pending)."""
     md_file = tmp_path / "tasks.md"
     md_file.write_text("""
@@ -288,29 +284,23 @@ def test_import_md_preserves_status(runner, tmp_path):
 - [X] Another completed task
 """)
 
-    with runner.isolated_filesystem():
-        runner.invoke(cli, ["init"])
-        runner.invoke(cli, ["import-md", str(md_file)])
-
-        # Check that completed tasks show up in --all but not in default list
-        default_list = runner.invoke(cli, ["list"])
-        all_list = runner.invoke(cli, ["list", "--all"])
+    monkeypatch.chdir(tmp_path)
+    storage = bootstrap()
+    runner.invoke(cli, ["import-md", str(md_file)])
 
-        assert "Pending task" in default_list.output
-        assert "Completed task" not in default_list.output
-        assert "Another completed task" not in default_list.output
+    # Check statuses directly in storage
+    statuses = {task.title: task.status.value for task in storage.load_tasks()}
+    assert statuses == {
+        "Pending task": "pending",
+        "Completed task": "completed",
+        "Another completed task": "completed",
+    }
 
-        assert "Pending task" in all_list.output
-        assert "Completed task" in all_list.output
-        assert "Another completed task" in all_list.output
 
-
-def test_nested_init_parent_and_child(runner, tmp_path):
+def test_nested_init_parent_and_child(runner, tmp_path, monkeypatch):
     """Test that nested gitdo projects can be initialized independently."""
-    import os
-
     # Initialize parent directory
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
     parent_result = runner.invoke(cli, ["init"])
     assert parent_result.exit_code == 0
     assert "initialized successfully" in parent_result.output.lower()
@@ -320,7 +310,7 @@ def test_nested_init_parent_and_child(runner, tmp_path):
     # Create and initialize child directory
     child_dir = tmp_path / "child"
     child_dir.mkdir()
-    os.chdir(child_dir)
+    monkeypatch.chdir(child_dir)
     child_result = runner.invoke(cli, ["init"])
     assert child_result.exit_code == 0
     assert "initialized successfully" in child_result.output.lower()
@@ -328,12 +318,10 @@ def test_nested_init_parent_and_child(runner, tmp_path):
     assert (child_dir / ".gitdo" / "tasks.json").exists()
 
 
-def test_nested_projects_have_independent_tasks(runner, tmp_path):
+def test_nested_projects_have_independent_tasks(runner, tmp_path, monkeypatch):
     """Test that nested projects maintain independent task lists."""
-    import os
-
     # Initialize and add task in parent
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
     runner.invoke(cli, ["init"])
     parent_add = runner.invoke(cli, ["add", "Parent task"])
     assert parent_add.exit_code == 0
@@ -341,46 +329,42 @@ def test_nested_projects_have_independent_tasks(runner, tmp_path):
     # Initialize and add task in child
     child_dir = tmp_path / "child"
     child_dir.mkdir()
-    os.chdir(child_dir)
+    monkeypatch.chdir(child_dir)
     runner.invoke(cli, ["init"])
     child_add = runner.invoke(cli, ["add", "Child task"])
     assert child_add.exit_code == 0
 
     # Verify parent only has parent task
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
     parent_list = runner.invoke(cli, ["list"])
     assert "Parent task" in parent_list.output
     assert "Child task" not in parent_list.output
 
     # Verify child only has child task
-    os.chdir(child_dir)
+    monkeypatch.chdir(child_dir)
     child_list = runner.invoke(cli, ["list"])
     assert "Child task" in child_list.output
     assert "Parent task" not in child_list.output
 
 
-def test_init_does_not_check_parent_directories(runner, tmp_path):
+def test_init_does_not_check_parent_directories(runner, tmp_path, monkeypatch):
     """Test that init command only checks current directory, not parents."""
-    import os
-
     # Initialize parent
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
     runner.invoke(cli, ["init"])
 
     # Create subdirectory and init there (should succeed)
     subdir = tmp_path / "subdir"
     subdir.mkdir()
-    os.chdir(subdir)
+    monkeypatch.chdir(subdir)
     result = runner.invoke(cli, ["init"])
     assert result.exit_code == 0
     assert "initialized successfully" in result.output.lower()
     assert (subdir / ".gitdo").exists()
 
 
-def test_nested_init_deeply_nested(runner, tmp_path):
+def test_nested_init_deeply_nested(runner, tmp_path, monkeypatch):
     """Test nested initialization works at multiple levels."""
-    import os
-
     # Create directory structure: root -> level1 -> level2
     level1 = tmp_path / "level1"
     level2 = level1 / "level2"
@@ -388,14 +372,14 @@ def test_nested_init_deeply_nested(runner, tmp_path):
     level2.mkdir()
 
     # Initialize at each level
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
     runner.invoke(cli, ["init"])
 
-    os.chdir(level1)
+    monkeypatch.chdir(level1)
     result1 = runner.invoke(cli, ["init"])
     assert result1.exit_code == 0
 
-    os.chdir(level2)
+    monkeypatch.chdir(level2)
     result2 = runner.invoke(cli, ["init"])
     assert result2.exit_code == 0
 
@@ -405,19 +389,17 @@ def test_nested_init_deeply_nested(runner, tmp_path):
     assert (level2 / ".gitdo").exists()
 
 
-def test_commands_use_walkup_in_nested_projects(runner, tmp_path):
+def test_commands_use_walkup_in_nested_projects(runner, tmp_path, monkeypatch):
     """Test that commands still use walk-up logic within a project."""
-    import os
-
     # Initialize parent
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
     runner.invoke(cli, ["init"])
     runner.invoke(cli, ["add", "Root task"])
 
     # Create subdirectory WITHOUT init
     subdir = tmp_path / "subdir"
     subdir.mkdir()
-    os.chdir(subdir)
+    monkeypatch.chdir(subdir)
 
     # List should find parent's tasks (walk-up logic)
     result = runner.invoke(cli, ["list"])
@@ -0,0 +1,69 @@
+"""Tests for the JSON-Lines storage backend."""
+
+import pytest
+
+from gitdo.jsonl_storage import JsonlStorage
+from gitdo.models import TaskStatus
+
+
+@pytest.fixture
+def jsonl_storage(temp_dir):
+    """Create and initialize a JSON-Lines storage instance."""
+    storage = JsonlStorage(base_path=temp_dir)
+    storage.init()
+    return storage
+
+
+def test_jsonl_add_and_load(jsonl_storage):
+    """Test adding and loading tasks."""
+    task = jsonl_storage.add_task("Test task")
+    tasks = jsonl_storage.load_tasks()
+
+    assert len(tasks) == 1
+    assert tasks[0].id == task.id
+    assert tasks[0].status == TaskStatus.PENDING
+
+
+def test_jsonl_complete_task(jsonl_storage):
+    """Test completing a task."""
+    task = jsonl_storage.add_task("Test task")
+
+    assert jsonl_storage.complete_task(task.id[:8]) is True
+
+    completed = jsonl_storage.get_task(task.id)
+    assert completed.status == TaskStatus.COMPLETED
+    assert completed.completed_at is not None
+
+
+def test_jsonl_remove_task(jsonl_storage):
+    """Test removing a task."""
+    task = jsonl_storage.add_task("Test task")
+
+    assert jsonl_storage.remove_task(task.id[:8]) is True
+    assert jsonl_storage.load_tasks() == []
+    assert jsonl_storage.remove_task("nonexistent") is False
+
+
+def test_jsonl_persistence_across_instances(jsonl_storage, temp_dir):
+    """Test that logged mutations survive a new storage instance."""
+    task = jsonl_storage.add_task("Test task")
+    jsonl_storage.complete_task(task.id)
+
+    new_storage = JsonlStorage(base_path=temp_dir)
+    tasks = new_storage.load_tasks()
+    assert len(tasks) == 1
+    assert tasks[0].status == TaskStatus.COMPLETED
+
+
+def test_jsonl_compaction_folds_log_into_snapshot(jsonl_storage):
+    """Test that a grown log is compacted back into tasks.json."""
+    for i in range(10):
+        jsonl_storage.add_task(f"Task {i}")
+
+    # Compaction triggers whenever the log outgrows half the snapshot,
+    # so after many adds the log must have been folded away.
+    assert (
+        not jsonl_storage.log_file.exists()
+        or jsonl_storage.log_file.stat().st_size <= jsonl_storage.tasks_file.stat().st_size // 2
+    )
+    assert len(jsonl_storage.load_tasks()) == 10
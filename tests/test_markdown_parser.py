@@ -8,55 +8,50 @@ from gitdo.markdown_parser import extract_checkbox_items, parse_markdown_file
 from gitdo.models import TaskStatus
 
 
-def test_extract_checkbox_items_basic():
-    """Test extracting basic checkbox items."""
-    content = """
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        pytest.param(
+            """
 # My Tasks
 
 - [ ] Task 1
 - [x] Task 2
 - [ ] Task 3
-"""
-    items = extract_checkbox_items(content)
-    assert len(items) == 3
-    assert items[0] == ("Task 1", False)
-    assert items[1] == ("Task 2", True)
-    assert items[2] == ("Task 3", False)
-
-
-def test_extract_checkbox_items_uppercase_x():
-    """Test extracting checkbox items with uppercase X."""
-    content = """
+""",
+            [("Task 1", False), ("Task 2", True), ("Task 3", False)],
+            id="basic",
+        ),
+        pytest.param(
+            """
 - [ ] Pending task
 - [X] Completed task
 - [x] Another completed task
-"""
-    items = extract_checkbox_items(content)
-    assert len(items) == 3
-    assert items[0] == ("Pending task", False)
-    assert items[1] == ("Completed task", True)
-    assert items[2] == ("Another completed task", True)
-
-
-def test_extract_checkbox_items_with_indentation():
-    """Test extracting checkbox items with various indentation levels."""
-    content = """
+""",
+            [
+                ("Pending task", False),
+                ("Completed task", True),
+                ("Another completed task", True),
+            ],
+            id="uppercase-x",
+        ),
+        pytest.param(
+            """
 - [ ] Level 0
   - [ ] Level 1
     - [ ] Level 2
       - [ ] Level 3
-"""
-    items = extract_checkbox_items(content)
-    assert len(items) == 4
-    assert items[0][0] == "Level 0"
-    assert items[1][0] == "Level 1"
-    assert items[2][0] == "Level 2"
-    assert items[3][0] == "Level 3"
-
-
-def test_extract_checkbox_items_mixed_content():
-    """Test extracting checkbox items from mixed markdown content."""
-    content = """
+""",
+            [
+                ("Level 0", False),
+                ("Level 1", False),
+                ("Level 2", False),
+                ("Level 3", False),
+            ],
+            id="indentation",
+        ),
+        pytest.param(
+            """
 # Project Tasks
 
 Some intro text here.
@@ -73,24 +68,26 @@ Not a task item
 - [ ] Update dependencies
 
 Random text
-"""
-    items = extract_checkbox_items(content)
-    assert len(items) == 4
-    assert items[0] == ("Add authentication", False)
-    assert items[1] == ("Setup database", True)
-    assert items[2] == ("Fix login issue", False)
-    assert items[3] == ("Update dependencies", False)
-
-
-def test_extract_checkbox_items_empty_content():
-    """Test extracting from empty content."""
-    items = extract_checkbox_items("")
-    assert items == []
-
-
-def test_extract_checkbox_items_no_checkboxes():
-    """Test extracting from content without checkboxes."""
-    content = """
+""",
+            [
+                ("Add authentication", False),
+                ("Setup database", True),
+                ("Fix login issue", False),
+                ("Update dependencies", False),
+            ],
+            id="mixed-content",
+        ),
+        pytest.param(
+            """
+* [ ] Star bullet
++ [x] Plus bullet
+""",
+            [("Star bullet", False), ("Plus bullet", True)],
+            id="alternate-bullets",
+        ),
+        pytest.param("", [], id="empty-content"),
+        pytest.param(
+            """
 # Regular Markdown
 
 Some text here.
@@ -99,39 +96,35 @@ Some text here.
 - Another bullet
 
 No checkboxes at all.
-"""
-    items = extract_checkbox_items(content)
-    assert items == []
-
-
-def test_extract_checkbox_items_special_characters():
-    """Test extracting items with special characters in titles."""
-    content = """
+""",
+            [],
+            id="no-checkboxes",
+        ),
+        pytest.param(
+            """
 - [ ] Fix bug #123
 - [x] Update config.json file
 - [ ] Add @mentions support
 - [ ] Handle "quoted strings"
-"""
-    items = extract_checkbox_items(content)
-    assert len(items) == 4
-    assert items[0][0] == "Fix bug #123"
-    assert items[1][0] == "Update config.json file"
-    assert items[2][0] == "Add @mentions support"
-    assert items[3][0] == 'Handle "quoted strings"'
-
-
-def test_parse_markdown_file_basic(tmp_path):
+""",
+            [
+                ("Fix bug #123", False),
+                ("Update config.json file", True),
+                ("Add @mentions support", False),
+                ('Handle "quoted strings"', False),
+            ],
+            id="special-characters",
+        ),
+    ],
+)
+def test_extract_checkbox_items(content, expected):
+    """Test extracting checkbox items from markdown content."""
+    assert extract_checkbox_items(content) == expected
+
+
+def test_parse_markdown_file_basic(basic_md):
     """Test parsing a basic markdown file."""
-    md_file = tmp_path / "tasks.md"
-    md_file.write_text("""
-# Tasks
-
-- [ ] Task 1
-- [x] Task 2
-- [ ] Task 3
-""")
-
-    tasks = parse_markdown_file(md_file)
+    tasks = parse_markdown_file(basic_md)
     assert len(tasks) == 3
     assert tasks[0].title == "Task 1"
     assert tasks[0].status == TaskStatus.PENDING
@@ -185,31 +178,9 @@ No checkbox items.
     assert tasks == []
 
 
-def test_parse_markdown_file_complex(tmp_path):
+def test_parse_markdown_file_complex(project_md):
     """Test parsing a complex markdown file."""
-    md_file = tmp_path / "complex.md"
-    md_file.write_text("""
-# GitDo Project
-
-## Phase 1 - Setup
-- [x] Initialize repository
-- [x] Setup project structure
-- [ ] Configure CI/CD
-
-## Phase 2 - Core Features
-- [ ] Implement task storage
-  - [ ] Add JSON persistence
-  - [ ] Add file discovery
-- [ ] Create CLI interface
-  - [x] Add init command
-  - [ ] Add list command
-
-## Phase 3 - Advanced
-- [ ] Add markdown import
-- [ ] Add task filtering
-""")
-
-    tasks = parse_markdown_file(md_file)
+    tasks = parse_markdown_file(project_md)
     assert len(tasks) == 11
 
     # Check completed tasks
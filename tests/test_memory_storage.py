@@ -0,0 +1,60 @@
+"""Tests for the in-memory storage backend."""
+
+import pytest
+
+from gitdo.memory_storage import InMemoryStorage
+from gitdo.models import TaskStatus
+
+
+@pytest.fixture
+def memory_storage(tmp_path):
+    """Create and initialize an in-memory storage instance."""
+    storage = InMemoryStorage(base_path=tmp_path)
+    storage.init()
+    return storage
+
+
+def test_memory_add_and_load(memory_storage):
+    """Test adding and loading tasks."""
+    task = memory_storage.add_task("Test task")
+    tasks = memory_storage.load_tasks()
+
+    assert len(tasks) == 1
+    assert tasks[0].id == task.id
+    assert tasks[0].status == TaskStatus.PENDING
+
+
+def test_memory_complete_task(memory_storage):
+    """Test completing a task by short ID."""
+    task = memory_storage.add_task("Test task")
+
+    assert memory_storage.complete_task(task.id[:8]) is True
+
+    completed = memory_storage.get_task(task.id)
+    assert completed.status == TaskStatus.COMPLETED
+    assert completed.completed_at is not None
+
+
+def test_memory_remove_task(memory_storage):
+    """Test removing a task."""
+    task = memory_storage.add_task("Test task")
+
+    assert memory_storage.remove_task(task.id[:8]) is True
+    assert memory_storage.load_tasks() == []
+    assert memory_storage.remove_task("nonexistent") is False
+
+
+def test_memory_requires_init(tmp_path):
+    """Test that the backend reports uninitialized before init()."""
+    storage = InMemoryStorage(base_path=tmp_path)
+    assert not storage.is_initialized()
+    storage.init()
+    assert storage.is_initialized()
+
+
+def test_memory_never_touches_disk(memory_storage, tmp_path):
+    """Test that no .gitdo folder is created on disk."""
+    memory_storage.add_task("Test task")
+    memory_storage.load_tasks()
+
+    assert not (tmp_path / ".gitdo").exists()
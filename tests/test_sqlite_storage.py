@@ -0,0 +1,122 @@
+"""Tests for the SQLite storage backend."""
+
+from uuid import uuid4
+
+import pytest
+
+from gitdo.models import Task, TaskStatus
+from gitdo.sqlite_storage import SqliteStorage
+from gitdo.storage import Storage, get_storage
+
+
+@pytest.fixture
+def sqlite_storage(temp_dir):
+    """Create and initialize an SQLite storage instance."""
+    storage = SqliteStorage(base_path=temp_dir)
+    storage.init()
+    return storage
+
+
+def test_sqlite_storage_init(temp_dir):
+    """Test SQLite storage initialization."""
+    storage = SqliteStorage(base_path=temp_dir)
+    assert not storage.is_initialized()
+    storage.init()
+    assert storage.is_initialized()
+    assert storage.db_file.exists()
+
+
+def test_sqlite_add_and_load(sqlite_storage):
+    """Test adding and loading tasks."""
+    task = sqlite_storage.add_task("Test task")
+    tasks = sqlite_storage.load_tasks()
+
+    assert len(tasks) == 1
+    assert tasks[0].id == task.id
+    assert tasks[0].title == "Test task"
+    assert tasks[0].status == TaskStatus.PENDING
+
+
+def test_sqlite_get_task_by_prefix(sqlite_storage):
+    """Test getting a task by full ID and by prefix."""
+    task = sqlite_storage.add_task("Test task")
+
+    assert sqlite_storage.get_task(task.id).id == task.id
+    assert sqlite_storage.get_task(task.id[:8]).id == task.id
+    assert sqlite_storage.get_task("nonexistent") is None
+
+
+def test_sqlite_like_wildcards_not_interpreted(sqlite_storage):
+    """Test that SQL wildcards in an ID lookup match literally."""
+    sqlite_storage.add_task("Test task")
+
+    assert sqlite_storage.get_task("%") is None
+    assert sqlite_storage.get_task("_") is None
+    assert sqlite_storage.remove_task("%") is False
+    assert len(sqlite_storage.load_tasks()) == 1
+
+
+def test_sqlite_complete_task(sqlite_storage):
+    """Test completing a task."""
+    task = sqlite_storage.add_task("Test task")
+
+    assert sqlite_storage.complete_task(task.id[:8]) is True
+
+    completed = sqlite_storage.get_task(task.id)
+    assert completed.status == TaskStatus.COMPLETED
+    assert completed.completed_at is not None
+
+
+def test_sqlite_start_task(sqlite_storage):
+    """Test starting a task."""
+    task = sqlite_storage.add_task("Test task")
+
+    assert sqlite_storage.start_task(task.id[:8]) is True
+    assert sqlite_storage.get_task(task.id).status == TaskStatus.INPROGRESS
+
+
+def test_sqlite_remove_task(sqlite_storage):
+    """Test removing a task."""
+    task = sqlite_storage.add_task("Test task")
+
+    assert sqlite_storage.remove_task(task.id[:8]) is True
+    assert sqlite_storage.load_tasks() == []
+    assert sqlite_storage.remove_task("nonexistent") is False
+
+
+def test_sqlite_import_tasks_skip_duplicates(sqlite_storage):
+    """Test importing tasks with duplicate skipping."""
+    sqlite_storage.add_task("Duplicate task")
+
+    tasks = [
+        Task(id=str(uuid4()), title="Duplicate task"),
+        Task(id=str(uuid4()), title="Unique task"),
+    ]
+    imported, skipped = sqlite_storage.import_tasks(tasks, skip_duplicates=True)
+
+    assert imported == 1
+    assert skipped == 1
+    assert len(sqlite_storage.load_tasks()) == 2
+
+
+def test_sqlite_migrates_existing_tasks_json(temp_dir):
+    """Test that init imports tasks from an existing tasks.json."""
+    json_storage = Storage(base_path=temp_dir)
+    json_storage.init()
+    task = json_storage.add_task("Migrated task")
+
+    sqlite_storage = SqliteStorage(base_path=temp_dir)
+    sqlite_storage.init()
+
+    tasks = sqlite_storage.load_tasks()
+    assert len(tasks) == 1
+    assert tasks[0].id == task.id
+    assert tasks[0].title == "Migrated task"
+
+
+def test_get_storage_selects_backend(temp_dir, monkeypatch):
+    """Test that get_storage honors the GITDO_STORAGE env var."""
+    assert isinstance(get_storage(temp_dir), Storage)
+
+    monkeypatch.setenv("GITDO_STORAGE", "sqlite")
+    assert isinstance(get_storage(temp_dir), SqliteStorage)
@@ -1,7 +1,8 @@
 """Tests for storage functionality."""
 
 import json
-import os
+
+import pytest
 
 from gitdo.models import TaskStatus
 from gitdo.storage import Storage
@@ -27,8 +28,7 @@ def test_add_task(initialized_storage):
 
 def test_load_tasks(initialized_storage):
     """Test loading tasks."""
-    initialized_storage.add_task("Task 1")
-    initialized_storage.add_task("Task 2")
+    initialized_storage.add_tasks(["Task 1", "Task 2"])
 
     tasks = initialized_storage.load_tasks()
     assert len(tasks) == 2
@@ -36,6 +36,15 @@ def test_load_tasks(initialized_storage):
     assert tasks[1].title == "Task 2"
 
 
+def test_add_tasks_bulk(initialized_storage):
+    """Test adding multiple tasks at once."""
+    created = initialized_storage.add_tasks(["Task 1", "Task 2", "Task 3"])
+
+    assert [task.title for task in created] == ["Task 1", "Task 2", "Task 3"]
+    assert len(initialized_storage.load_tasks()) == 3
+    assert len({task.id for task in created}) == 3
+
+
 def test_get_task(initialized_storage):
     """Test getting a task by ID."""
     task = initialized_storage.add_task("Test task")
@@ -117,39 +126,28 @@ def test_tasks_json_format(initialized_storage):
     assert data[0]["title"] == "Test task"
 
 
-def test_find_gitdo_root_in_current_dir(temp_dir):
-    """Test finding .gitdo/ in current directory."""
-    gitdo_dir = temp_dir / ".gitdo"
-    gitdo_dir.mkdir()
-
-    found_root = Storage._find_gitdo_root(temp_dir)
-    assert found_root == temp_dir.resolve()
+@pytest.fixture(scope="module")
+def walkup_tree(tmp_path_factory):
+    """Directory tree with .gitdo/ at the root and nested levels below it.
 
+    _find_gitdo_root never mutates the tree, so one module-scoped copy
+    serves every starting depth.
+    """
+    root = tmp_path_factory.mktemp("walkup")
+    (root / ".gitdo").mkdir()
+    (root / "lvl1" / "lvl2" / "lvl3").mkdir(parents=True)
+    return root
 
-def test_find_gitdo_root_in_parent_dir(temp_dir):
-    """Test finding .gitdo/ in parent directory."""
-    gitdo_dir = temp_dir / ".gitdo"
-    gitdo_dir.mkdir()
-
-    # Create a subdirectory
-    subdir = temp_dir / "subdir"
-    subdir.mkdir()
-
-    found_root = Storage._find_gitdo_root(subdir)
-    assert found_root == temp_dir.resolve()
-
-
-def test_find_gitdo_root_multiple_levels_up(temp_dir):
-    """Test finding .gitdo/ multiple levels up the directory tree."""
-    gitdo_dir = temp_dir / ".gitdo"
-    gitdo_dir.mkdir()
 
-    # Create nested subdirectories
-    deep_dir = temp_dir / "level1" / "level2" / "level3"
-    deep_dir.mkdir(parents=True)
+@pytest.mark.parametrize("depth", [0, 1, 2, 3])
+def test_find_gitdo_root_walks_up(walkup_tree, depth):
+    """Test finding .gitdo/ from the root and from nested subdirectories."""
+    start = walkup_tree
+    for level in range(1, depth + 1):
+        start = start / f"lvl{level}"
 
-    found_root = Storage._find_gitdo_root(deep_dir)
-    assert found_root == temp_dir.resolve()
+    found_root = Storage._find_gitdo_root(start)
+    assert found_root == walkup_tree.resolve()
 
 
 def test_find_gitdo_root_not_found(temp_dir):
@@ -159,7 +157,7 @@ def test_find_gitdo_root_not_found(temp_dir):
     assert found_root is None
 
 
-def test_storage_uses_walk_up_logic(temp_dir):
+def test_storage_uses_walk_up_logic(temp_dir, monkeypatch):
     """Test that Storage initialization uses walk-up logic."""
     # Create .gitdo/ in parent directory
     gitdo_dir = temp_dir / ".gitdo"
@@ -170,27 +168,19 @@ def test_storage_uses_walk_up_logic(temp_dir):
     subdir = temp_dir / "subdir"
     subdir.mkdir()
 
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(subdir)
-        # Create storage without base_path - should find parent's .gitdo/
-        storage = Storage()
-        assert storage.base_path == temp_dir.resolve()
-        assert storage.storage_dir == gitdo_dir.resolve()
-    finally:
-        os.chdir(original_cwd)
+    monkeypatch.chdir(subdir)
+    # Create storage without base_path - should find parent's .gitdo/
+    storage = Storage()
+    assert storage.base_path == temp_dir.resolve()
+    assert storage.storage_dir == gitdo_dir.resolve()
 
 
-def test_storage_falls_back_to_cwd_when_not_found(temp_dir):
+def test_storage_falls_back_to_cwd_when_not_found(temp_dir, monkeypatch):
     """Test that Storage falls back to current directory when .gitdo/ not found."""
     # Don't create .gitdo/ folder anywhere
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(temp_dir)
-        storage = Storage()
-        assert storage.base_path == temp_dir.resolve()
-    finally:
-        os.chdir(original_cwd)
+    monkeypatch.chdir(temp_dir)
+    storage = Storage()
+    assert storage.base_path == temp_dir.resolve()
 
 
 def test_storage_explicit_base_path_skips_walk_up(temp_dir):
@@ -264,7 +254,7 @@ def test_nested_init_allows_multiple_gitdo_folders(temp_dir):
     assert (child_dir / ".gitdo").exists()
 
 
-def test_nested_storage_walk_up_stops_at_first_gitdo(temp_dir):
+def test_nested_storage_walk_up_stops_at_first_gitdo(temp_dir, monkeypatch):
     """Test that walk-up stops at the nearest .gitdo folder."""
     # Create parent project
     parent_gitdo = temp_dir / ".gitdo"
@@ -287,14 +277,10 @@ def test_nested_storage_walk_up_stops_at_first_gitdo(temp_dir):
     assert found_root == child_dir.resolve()
 
     # Change to subdir and create storage without base_path
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(subdir)
-        storage = Storage()
-        assert storage.base_path == child_dir.resolve()
-        assert storage.storage_dir == child_gitdo.resolve()
-    finally:
-        os.chdir(original_cwd)
+    monkeypatch.chdir(subdir)
+    storage = Storage()
+    assert storage.base_path == child_dir.resolve()
+    assert storage.storage_dir == child_gitdo.resolve()
 
 
 def test_deeply_nested_projects(temp_dir):